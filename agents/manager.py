@@ -11,10 +11,20 @@ logger = logging.getLogger(__name__)
 class ManagerAgent:
     """The Manager Agent decides if document retrieval is needed and orchestrates the workflow."""
     
-    def __init__(self):
+    def __init__(self, retriever=None):
         self.llm_provider = Config.LLM_PROVIDER
         self.model_name = Config.MODEL_NAME
         self.mcp_server_url = Config.MCP_SERVER_URL
+        self.mcp_transport = "inprocess" if retriever is not None else Config.MCP_TRANSPORT
+        self.retriever = retriever
+        
+        # Load the knowledge base locally when bypassing the MCP server
+        if self.mcp_transport == "inprocess":
+            if self.retriever is None:
+                from mcp_server.retriever import DocumentRetriever
+                self.retriever = DocumentRetriever()
+        elif self.mcp_transport != "http":
+            raise ValueError(f"Unsupported MCP transport: {self.mcp_transport}")
         
         # Initialize LLM client based on provider
         if self.llm_provider == "ollama":
@@ -45,12 +55,18 @@ class ManagerAgent:
             search_query = query or user_question
             logger.info(f"Searching with query: {search_query}")
             
-            retrieved_context = self._call_mcp_server(search_query)
+            retrieved_context = self.retrieve(search_query)
             return True, search_query, retrieved_context
         else:
             logger.info("No tool needed, proceeding without context")
             return False, None, None
     
+    def retrieve(self, query: str) -> Dict[str, Any]:
+        """Retrieve documents over the configured transport."""
+        if self.mcp_transport == "inprocess":
+            return self._call_retriever(query)
+        return self._call_mcp_server(query)
+    
     def _make_tool_decision(self, question: str) -> Dict[str, Any]:
         """Use LLM to decide if document_retriever tool is needed."""
         
@@ -128,13 +144,24 @@ Response: {"use_tool": false, "query": "", "reason": "General knowledge question
         try:
             response = client.chat(
                 model=self.model_name,
-                messages=messages
+                messages=messages,
+                options=Config.OLLAMA_OPTIONS
             )
             return response["message"]["content"]
         except Exception as e:
             logger.error(f"Ollama API error: {e}")
             raise
     
+    def _call_retriever(self, query: str) -> Dict[str, Any]:
+        """Search the local retriever directly, skipping HTTP and serialization."""
+        try:
+            snippets = self.retriever.search_raw(query)
+            logger.info(f"Retrieved {len(snippets)} snippets (in-process)")
+            return {"snippets": snippets}
+        except Exception as e:
+            logger.error(f"In-process retrieval error: {e}")
+            raise Exception(f"Failed to retrieve documents: {str(e)}")
+    
     def _call_mcp_server(self, query: str) -> Dict[str, Any]:
         """Call the MCP server to retrieve documents."""
         url = f"{self.mcp_server_url}/mcp/v1/tools/execute"
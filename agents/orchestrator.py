@@ -21,6 +21,7 @@ if _REPO_ROOT not in sys.path:
 from config import Config
 from agents.manager import ManagerAgent
 from agents.specialist import SpecialistAgent
+from agents.session import ConversationSession
 
 # Configure logging
 logging.basicConfig(
@@ -73,12 +74,69 @@ class DocumentAnalysisOrchestrator:
             logger.error(error_msg)
             return f"I apologize, but I encountered an error while processing your question: {error_msg}"
     
+    def process_followup(self, question: str, session: ConversationSession) -> str:
+        """
+        Process one turn of a conversation, reusing context held by the session.
+        
+        Follow-ups skip the Manager decision and only retrieve for terms the
+        held snippets do not cover. The Manager decides only on the first turn
+        (or while nothing is held) and when that retrieval finds nothing.
+        Held snippets stay in the conversation either way, so follow-ups like
+        "summarize that" keep their sources.
+        
+        Args:
+            question: The user's question
+            session: The conversation session to read from and update
+        
+        Returns:
+            The final answer with citations
+        """
+        start_time = time.time()
+        logger.info(f"Processing conversation turn: {question}")
+        
+        try:
+            retrieved_snippets = []
+            uncovered = session.uncovered_terms(question)
+            
+            if uncovered and session.has_context:
+                # Step 1: Retrieve only what the held snippets do not cover
+                search_query = " ".join(uncovered)
+                logger.info(f"Retrieving for uncovered terms: {search_query}")
+                retrieved_context = self.manager.retrieve(search_query)
+                retrieved_snippets = retrieved_context.get("snippets", [])
+            
+            if not session.has_context or (uncovered and not retrieved_snippets):
+                # Step 1b: Nothing found yet, so let the Manager route the question;
+                # held context stays available either way
+                tool_needed, search_query, retrieved_context = self.manager.decide(question)
+                if tool_needed and retrieved_context:
+                    retrieved_snippets = retrieved_context.get("snippets", [])
+            elif not uncovered:
+                logger.info("Held context covers the question, skipping retrieval")
+            
+            # Step 2: Specialist answers on top of the existing conversation
+            logger.info(f"Using {len(retrieved_snippets)} retrieved and {len(session.snippets)} held snippets")
+            answer = self.specialist.synthesize_turn(question, session, retrieved_snippets)
+            
+            # Log timing
+            processing_time = time.time() - start_time
+            logger.info(f"Turn processed in {processing_time:.2f} seconds")
+            
+            return answer
+            
+        except Exception as e:
+            error_msg = f"Error processing question: {str(e)}"
+            logger.error(error_msg)
+            return f"I apologize, but I encountered an error while processing your question: {error_msg}"
+    
     def interactive_mode(self):
         """Run the orchestrator in interactive mode."""
         print("Multi-Agent Document Analysis System")
-        print("Type 'quit' or 'exit' to end the session")
+        print("Type 'quit' or 'exit' to end the session, 'reset' to start a new conversation")
         print("-" * 50)
         
+        session = ConversationSession()
+        
         while True:
             try:
                 question = input("\nYour question: ").strip()
@@ -87,12 +145,17 @@ class DocumentAnalysisOrchestrator:
                     print("Goodbye!")
                     break
                 
+                if question.lower() == 'reset':
+                    session.reset()
+                    print("Conversation reset.")
+                    continue
+                
                 if not question:
                     print("Please enter a question.")
                     continue
                 
                 print("\nProcessing...")
-                answer = self.process_question(question)
+                answer = self.process_followup(question, session)
                 print(f"\nAnswer:\n{answer}")
                 print("-" * 50)
                 
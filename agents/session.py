@@ -0,0 +1,120 @@
+import re
+from typing import List, Dict, Any
+from config import Config
+
+TERM_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Words that carry no retrieval signal in follow-up questions
+STOPWORDS = {
+    "a", "about", "an", "and", "any", "are", "as", "at", "be", "but", "by",
+    "can", "compare", "could", "did", "do", "does", "for", "from", "has",
+    "have", "how", "i", "if", "in", "is", "it", "its", "me", "more", "of",
+    "on", "or", "our", "so", "tell", "than", "that", "the", "their", "them",
+    "then", "there", "these", "they", "this", "those", "to", "us", "vs",
+    "was", "we", "were", "what", "when", "where", "which", "who", "why",
+    "will", "with", "would", "you", "your",
+}
+
+class ConversationSession:
+    """Holds the message history and retrieved snippets of an interactive conversation."""
+
+    def __init__(self, max_turns: int = None, max_snippets: int = None):
+        self.max_turns = max_turns or Config.CONVERSATION_MAX_TURNS
+        self.max_snippets = max_snippets or Config.CONVERSATION_MAX_SNIPPETS
+        self.reset()
+
+    @property
+    def messages(self) -> List[Dict[str, str]]:
+        """Message history of the turns still held, oldest first."""
+        messages = []
+        for turn in self._turns:
+            messages.extend(turn["messages"])
+        return messages
+
+    @property
+    def snippets(self) -> List[Dict[str, Any]]:
+        """Held snippets, in citation order."""
+        return [snippet for turn in self._turns for snippet in turn["snippets"]]
+
+    @property
+    def first_citation(self) -> int:
+        """Citation number of the oldest held snippet."""
+        return self.next_citation - len(self.snippets)
+
+    @property
+    def has_context(self) -> bool:
+        return any(turn["snippets"] for turn in self._turns)
+
+    def context(self) -> Dict[str, Any]:
+        """Return all held snippets in the MCP result shape."""
+        return {"snippets": self.snippets}
+
+    def new_snippets(self, snippets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Filter retrieved snippets down to ones not already held.
+
+        Returns:
+            The unseen snippets, in citation order
+        """
+        fresh = []
+        seen = {self._key(snippet) for snippet in self.snippets}
+        for snippet in snippets:
+            key = self._key(snippet)
+            if key in seen:
+                continue
+            seen.add(key)
+            fresh.append(snippet)
+        return fresh
+
+    def question_terms(self, question: str) -> List[str]:
+        """Return the distinct question terms that carry retrieval signal."""
+        terms = []
+        for term in TERM_PATTERN.findall(question.lower()):
+            if term in STOPWORDS or len(term) < 2 or term in terms:
+                continue
+            terms.append(term)
+        return terms
+
+    def uncovered_terms(self, question: str) -> List[str]:
+        """Return question terms that do not appear as a word in any held snippet."""
+        held_terms = set()
+        for snippet in self.snippets:
+            held_terms.update(TERM_PATTERN.findall(snippet["content"].lower()))
+        return [term for term in self.question_terms(question) if term not in held_terms]
+
+    def record_turn(self, user_message: Dict[str, str], answer: str, snippets: List[Dict[str, Any]] = None):
+        """
+        Append a completed turn so later turns reuse it verbatim.
+
+        The snippets sent with the turn are only held from here on, so a
+        failed turn never leaves context the model has not seen. Oldest
+        turns are evicted, snippets included, once the session is over
+        its turn or snippet budget; evicted snippets get retrieved again
+        when a later question needs them.
+        """
+        snippets = list(snippets or [])
+        self._turns.append({
+            "messages": [user_message, {"role": "assistant", "content": answer}],
+            "snippets": snippets,
+        })
+        self.next_citation += len(snippets)
+        self.turn_count += 1
+
+        # Always keep the turn just recorded
+        while len(self._turns) > 1 and (
+            len(self._turns) > self.max_turns or len(self.snippets) > self.max_snippets
+        ):
+            self._turns.pop(0)
+
+    def reset(self):
+        """Forget the conversation history and held snippets."""
+        self._turns: List[Dict[str, Any]] = []
+        # Citation numbers keep increasing across evictions so the
+        # numbers in held turns stay valid
+        self.next_citation = 1
+        # Completed turns, including evicted ones
+        self.turn_count = 0
+
+    @staticmethod
+    def _key(snippet: Dict[str, Any]) -> tuple:
+        return (snippet["source"], snippet.get("section"))
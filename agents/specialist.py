@@ -1,11 +1,21 @@
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from config import Config
 
 # Configure logging
 logging.basicConfig(level=getattr(logging, Config.LOG_LEVEL))
 logger = logging.getLogger(__name__)
 
+CONVERSATION_SYSTEM_PROMPT = """You are a meticulous technical analyst in an ongoing conversation. Retrieved context is numbered [1], [2], etc. and may have been provided in earlier turns; it stays valid while it remains in the conversation.
+
+RULES:
+1. For questions about the provided context, answer ONLY from it
+2. Cite context using its inline citation numbers, e.g. [1], [2]
+3. For general-knowledge questions the context does not address, answer from general knowledge and say that no internal sources were used
+4. If the context is relevant but insufficient, state this explicitly
+5. Be precise with numbers, dates, and technical terms
+6. Use earlier turns to resolve follow-up questions"""
+
 class SpecialistAgent:
     """The Specialist Agent synthesizes high-quality answers with citations."""
     
@@ -45,6 +55,64 @@ class SpecialistAgent:
         logger.info("Answer synthesis complete")
         return formatted_response
     
+    def synthesize_turn(self, question: str, session, retrieved_snippets: Optional[List[Dict[str, Any]]] = None) -> str:
+        """
+        Synthesize an answer for one turn of a conversation session.
+        
+        Earlier turns are sent back to the LLM unchanged and only the snippets
+        retrieved for this turn are added, so the model can reuse the prompt
+        prefix it has already processed.
+        
+        Args:
+            question: The user's question for this turn
+            session: ConversationSession holding the history and snippets
+            retrieved_snippets: Snippets retrieved for this turn (optional);
+                unseen ones are held by the session once the turn succeeds
+        
+        Returns:
+            Formatted answer with citations
+        """
+        logger.info(f"Specialist synthesizing turn {session.turn_count + 1} for: {question}")
+        
+        new_snippets = session.new_snippets(retrieved_snippets or [])
+        user_message = {"role": "user", "content": self._build_turn_prompt(question, session, new_snippets)}
+        messages = [{"role": "system", "content": CONVERSATION_SYSTEM_PROMPT}]
+        messages.extend(session.messages)
+        messages.append(user_message)
+        
+        try:
+            response = self._call_chat(messages)
+        except Exception as e:
+            logger.error(f"LLM API error: {e}")
+            return f"Error generating response: {str(e)}"
+        
+        # Only completed turns become part of the reusable history
+        session.record_turn(user_message, response, new_snippets)
+        
+        formatted_response = self._format_response(response, session.context(), session.first_citation)
+        logger.info("Answer synthesis complete")
+        return formatted_response
+    
+    def _build_turn_prompt(self, question: str, session, new_snippets: Optional[List[Dict[str, Any]]] = None) -> str:
+        """Build the user message for one conversation turn, before its snippets are held."""
+        if new_snippets:
+            # Continue the session-wide citation numbering
+            first_index = session.next_citation
+            context_text = "RETRIEVED CONTEXT:\n\n"
+            for i, snippet in enumerate(new_snippets, first_index):
+                source_info = f"[{i}] {snippet['source']}"
+                if snippet.get("section"):
+                    source_info += f" (Section: {snippet['section']})"
+                
+                context_text += f"{source_info}\n{snippet['content']}\n\n"
+            
+            return f"User Question: {question}\n\n{context_text}\nBased on the provided context, please answer the user's question."
+        
+        if session.has_context:
+            return f"User Question: {question}\n\nNo new context was retrieved. Answer using the context provided earlier in this conversation."
+        
+        return f"User Question: {question}\n\nNo specific context was provided. Please answer based on general knowledge."
+    
     def _build_prompt(self, question: str, context: Dict[str, Any] = None) -> str:
         """Build the prompt for the Specialist Agent."""
         if context and context.get("snippets"):
@@ -92,23 +160,33 @@ If the user requests citations or references, say that no internal sources were
             logger.error(f"LLM API error: {e}")
             return f"Error generating response: {str(e)}"
     
-    def _call_ollama(self, prompt: str) -> str:
+    def _call_chat(self, messages: List[Dict[str, str]]) -> str:
+        """Call the LLM API with a full message history."""
+        if self.llm_provider == "ollama":
+            return self._call_ollama(messages=messages)
+        raise ValueError(f"Unsupported LLM provider: {self.llm_provider}")
+    
+    def _call_ollama(self, prompt: str = None, messages: List[Dict[str, str]] = None) -> str:
         """Call Ollama API."""
         import ollama
         
         client = ollama.Client(host=self.base_url)
         
+        if messages is None:
+            messages = [{"role": "user", "content": prompt}]
+        
         try:
             response = client.chat(
                 model=self.model_name,
-                messages=[{"role": "user", "content": prompt}]
+                messages=messages,
+                options=Config.OLLAMA_OPTIONS
             )
             return response["message"]["content"]
         except Exception as e:
             logger.error(f"Ollama API error: {e}")
             raise
     
-    def _format_response(self, response: str, context: Dict[str, Any] = None) -> str:
+    def _format_response(self, response: str, context: Dict[str, Any] = None, first_index: int = 1) -> str:
         """Format the response with proper source citations."""
         
         if not context or not context.get("snippets"):
@@ -117,7 +195,7 @@ If the user requests citations or references, say that no internal sources were
         
         # Extract sources from context
         sources = []
-        for i, snippet in enumerate(context["snippets"], 1):
+        for i, snippet in enumerate(context["snippets"], first_index):
             source_info = f"[{i}] {snippet['source']}"
             if snippet.get("section"):
                 source_info += f" (Section: {snippet['section']})"
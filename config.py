@@ -11,11 +11,23 @@ class Config:
     
     # Ollama Settings
     OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+    # Context window for every call to MODEL_NAME; Ollama's default is small
+    # and silently drops the oldest tokens when exceeded. All calls share it
+    # because Ollama reloads the model (losing its prompt cache) on change.
+    OLLAMA_NUM_CTX = int(os.getenv("OLLAMA_NUM_CTX", "8192"))
+    OLLAMA_OPTIONS = {"num_ctx": OLLAMA_NUM_CTX}
+    
+    # Interactive conversations: oldest turns are dropped past these limits
+    CONVERSATION_MAX_TURNS = int(os.getenv("CONVERSATION_MAX_TURNS", "6"))
+    CONVERSATION_MAX_SNIPPETS = int(os.getenv("CONVERSATION_MAX_SNIPPETS", "10"))
     
     # MCP Server
     MCP_SERVER_HOST = os.getenv("MCP_SERVER_HOST", "localhost")
     MCP_SERVER_PORT = int(os.getenv("MCP_SERVER_PORT", "8000"))
     MCP_SERVER_URL = f"http://{MCP_SERVER_HOST}:{MCP_SERVER_PORT}"
+    # "http" calls a (possibly remote) MCP server; "inprocess" searches the
+    # knowledge base directly when agents and index share a machine
+    MCP_TRANSPORT = os.getenv("MCP_TRANSPORT", "http").lower()
     
     # Paths
     KNOWLEDGE_BASE_PATH = os.getenv("KNOWLEDGE_BASE_PATH", "./knowledge_base")
@@ -31,7 +31,16 @@ class DocumentRetriever:
     
     def search(self, query: str) -> List[DocumentSnippet]:
         """Search for relevant document snippets using keyword matching."""
-        snippets = []
+        return [DocumentSnippet(**snippet) for snippet in self.search_raw(query)]
+    
+    def search_raw(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Search like search(), but return plain snippet dicts.
+        
+        The dicts already have the shape of the MCP response snippets, so
+        in-process callers can use them directly without building models.
+        """
+        scored = []
         query_terms = query.lower().split()
         
         for filename, content in self.documents.items():
@@ -43,18 +52,18 @@ class DocumentRetriever:
                 score = self._calculate_relevance(query_terms, section_content)
                 
                 if score > 0:  # Only include sections with matches
-                    snippet = DocumentSnippet(
-                        content=section_content.strip(),
-                        source=filename,
-                        section=section_name
-                    )
-                    snippets.append(snippet)
+                    snippet = {
+                        "content": section_content,
+                        "source": filename,
+                        "section": section_name
+                    }
+                    scored.append((score, snippet))
         
         # Sort by relevance score (descending)
-        snippets.sort(key=lambda x: self._calculate_relevance(query_terms, x.content), reverse=True)
+        scored.sort(key=lambda x: x[0], reverse=True)
         
         # Return top 5 most relevant snippets
-        return snippets[:5]
+        return [snippet for _, snippet in scored[:5]]
     
     def _split_into_sections(self, content: str) -> List[tuple]:
         """Split document content into sections based on markdown headings."""
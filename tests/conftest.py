@@ -0,0 +1,23 @@
+import os
+import sys
+import types
+
+import pytest
+
+# Allow importing the agents package when running pytest from repo root.
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+
+@pytest.fixture
+def fake_ollama(monkeypatch):
+    """Stand-in ollama module so agents can be built without an Ollama server."""
+    module = types.ModuleType("ollama")
+    module.Client = object
+    monkeypatch.setitem(sys.modules, "ollama", module)
+    return module
+
+
+def make_snippet(source, section, content):
+    return {"content": content, "source": source, "section": section}
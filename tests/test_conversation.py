@@ -0,0 +1,205 @@
+import pytest
+
+from conftest import make_snippet
+
+
+@pytest.fixture
+def specialist(fake_ollama):
+    from agents.specialist import SpecialistAgent
+    return SpecialistAgent()
+
+
+def test_turn_prompt_continues_citation_numbering(specialist):
+    from agents.session import ConversationSession
+
+    session = ConversationSession()
+    session.record_turn(
+        {"role": "user", "content": "q"}, "answer",
+        [make_snippet("a.md", "One", "first"), make_snippet("b.md", "Two", "second")],
+    )
+
+    prompt = specialist._build_turn_prompt(
+        "follow-up", session, [make_snippet("c.md", "Three", "third")]
+    )
+
+    assert "[3] c.md (Section: Three)" in prompt
+    assert "[1]" not in prompt
+
+
+def test_turn_prompt_numbering_after_eviction(specialist):
+    from agents.session import ConversationSession
+
+    session = ConversationSession(max_turns=1)
+    session.record_turn({"role": "user", "content": "q0"}, "a0", [make_snippet("a.md", "S", "x")])
+    session.record_turn({"role": "user", "content": "q1"}, "a1", [make_snippet("b.md", "S", "y")])
+
+    prompt = specialist._build_turn_prompt("q2", session, [make_snippet("c.md", "S", "z")])
+
+    assert "[3] c.md" in prompt
+
+
+def test_failed_turn_does_not_hold_snippets(specialist, monkeypatch):
+    from agents.session import ConversationSession
+
+    session = ConversationSession()
+    snippets = [make_snippet("a.md", "Latency", "Latency dropped to 120ms")]
+
+    def fail(messages):
+        raise RuntimeError("connection refused")
+
+    monkeypatch.setattr(specialist, "_call_chat", fail)
+    answer = specialist.synthesize_turn("what about latency?", session, snippets)
+
+    assert answer.startswith("Error generating response")
+    assert "Sources Referenced" not in answer
+    assert session.snippets == []
+    assert session.messages == []
+    # The question is still uncovered, so the next turn retrieves again
+    assert session.uncovered_terms("what about latency?") == ["latency"]
+
+
+def test_successful_turn_holds_snippets_and_cites_them(specialist, monkeypatch):
+    from agents.session import ConversationSession
+
+    session = ConversationSession()
+    snippets = [make_snippet("a.md", "Latency", "Latency dropped to 120ms")]
+    sent = []
+
+    def reply(messages):
+        sent.append(messages)
+        return "Latency is 120ms [1]"
+
+    monkeypatch.setattr(specialist, "_call_chat", reply)
+    answer = specialist.synthesize_turn("what about latency?", session, snippets)
+    specialist.synthesize_turn("and why?", session, [])
+
+    assert session.snippets == snippets
+    assert "[1] a.md (Section: Latency)" in answer
+    # The second call resends the first turn unchanged
+    assert sent[1][1:3] == session.messages[:2]
+    assert sent[1][0] == sent[0][0]
+
+
+class FakeManager:
+    """Records Manager calls; retrieve() returns snippets whose words match the query."""
+
+    def __init__(self, snippets):
+        self.snippets = snippets
+        self.decisions = 0
+        self.retrievals = []
+
+    def decide(self, question):
+        self.decisions += 1
+        return True, question, {"snippets": self.snippets}
+
+    def retrieve(self, query):
+        self.retrievals.append(query)
+        terms = query.lower().split()
+        return {"snippets": [s for s in self.snippets
+                             if any(term in s["content"].lower().split() for term in terms)]}
+
+
+LATENCY = make_snippet("q3.md", "Latency", "latency dropped to 120ms")
+COST = make_snippet("q3.md", "Cost", "cost per request fell 20%")
+
+
+@pytest.fixture
+def orchestrator(specialist, monkeypatch):
+    pytest.importorskip("requests")
+    from agents.orchestrator import DocumentAnalysisOrchestrator
+
+    orchestrator = DocumentAnalysisOrchestrator()
+    orchestrator.manager = FakeManager([LATENCY, COST])
+    orchestrator.specialist = specialist
+    orchestrator.sent = []
+
+    def reply(messages):
+        orchestrator.sent.append(messages)
+        return "answer [1]"
+
+    monkeypatch.setattr(specialist, "_call_chat", reply)
+    return orchestrator
+
+
+@pytest.fixture
+def session():
+    from agents.session import ConversationSession
+    return ConversationSession()
+
+
+def first_turn(orchestrator, session):
+    orchestrator.manager.snippets = [LATENCY]
+    orchestrator.process_followup("what about latency?", session)
+    orchestrator.manager.snippets = [LATENCY, COST]
+    orchestrator.manager.decisions = 0
+    orchestrator.manager.retrievals = []
+
+
+def test_first_turn_uses_manager_decision(orchestrator, session):
+    orchestrator.process_followup("what about latency?", session)
+
+    assert orchestrator.manager.decisions == 1
+    assert orchestrator.manager.retrievals == []
+
+
+def test_covered_followup_skips_retrieval(orchestrator, session):
+    first_turn(orchestrator, session)
+
+    answer = orchestrator.process_followup("and the latency?", session)
+
+    assert orchestrator.manager.decisions == 0
+    assert orchestrator.manager.retrievals == []
+    assert "[1] q3.md (Section: Latency)" in answer
+
+
+def test_partially_covered_followup_retrieves_uncovered_terms(orchestrator, session):
+    first_turn(orchestrator, session)
+
+    orchestrator.process_followup("latency and cost?", session)
+
+    assert orchestrator.manager.decisions == 0
+    assert orchestrator.manager.retrievals == ["cost"]
+    assert session.snippets == [LATENCY, COST]
+
+
+def test_unmatched_followup_retrieves_before_deciding(orchestrator, session):
+    first_turn(orchestrator, session)
+
+    orchestrator.process_followup("what about cost?", session)
+
+    assert orchestrator.manager.decisions == 0
+    assert orchestrator.manager.retrievals == ["cost"]
+    assert "[2] q3.md (Section: Cost)" in orchestrator.sent[-1][-1]["content"]
+
+
+def test_summarize_followup_keeps_held_sources(orchestrator, session):
+    first_turn(orchestrator, session)
+    orchestrator.manager.snippets = []
+
+    answer = orchestrator.process_followup("summarize that please", session)
+
+    # Nothing retrieved for the uncovered terms, so the Manager routes it
+    assert orchestrator.manager.retrievals == ["summarize please"]
+    assert orchestrator.manager.decisions == 1
+    assert "context provided earlier" in orchestrator.sent[-1][-1]["content"]
+    assert "[1] q3.md (Section: Latency)" in answer
+    assert session.snippets == [LATENCY]
+
+
+def test_followup_after_failed_turn_retrieves_again(orchestrator, session, monkeypatch):
+    calls = []
+
+    def flaky(messages):
+        calls.append(messages)
+        if len(calls) == 1:
+            raise RuntimeError("connection refused")
+        return "Latency is 120ms [1]"
+
+    monkeypatch.setattr(orchestrator.specialist, "_call_chat", flaky)
+    orchestrator.manager.snippets = [LATENCY]
+    orchestrator.process_followup("what about latency?", session)
+    answer = orchestrator.process_followup("what about latency?", session)
+
+    assert orchestrator.manager.decisions == 2
+    assert "latency dropped to 120ms" in calls[1][-1]["content"]
+    assert "[1] q3.md (Section: Latency)" in answer
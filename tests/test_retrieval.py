@@ -0,0 +1,70 @@
+import os
+
+import pytest
+
+from conftest import make_snippet
+
+KNOWLEDGE_BASE = os.path.join(os.path.dirname(__file__), "..", "knowledge_base")
+
+
+@pytest.fixture
+def retriever():
+    from mcp_server.retriever import DocumentRetriever
+    return DocumentRetriever(KNOWLEDGE_BASE)
+
+
+@pytest.mark.parametrize("query", [
+    "Q3 performance metrics Q2 comparison",
+    "data pipeline bottlenecks",
+    "latency",
+    "no such words anywhere zzqx",
+])
+def test_search_raw_matches_search(retriever, query):
+    expected = [
+        {"content": s.content, "source": s.source, "section": s.section}
+        for s in retriever.search(query)
+    ]
+
+    assert retriever.search_raw(query) == expected
+
+
+class FakeRetriever:
+    def __init__(self, snippets):
+        self.snippets = snippets
+        self.queries = []
+
+    def search_raw(self, query):
+        self.queries.append(query)
+        return self.snippets
+
+
+@pytest.fixture
+def manager_module(fake_ollama):
+    pytest.importorskip("requests")
+    from agents import manager
+    return manager
+
+
+def test_inprocess_retrieve_skips_http(manager_module, monkeypatch):
+    def no_http(*args, **kwargs):
+        raise AssertionError("in-process retrieval must not call the MCP server")
+
+    monkeypatch.setattr(manager_module.requests, "post", no_http, raising=False)
+    snippets = [make_snippet("a.md", "Latency", "latency dropped to 120ms")]
+    retriever = FakeRetriever(snippets)
+
+    agent = manager_module.ManagerAgent(retriever=retriever)
+    result = agent.retrieve("latency")
+
+    assert agent.mcp_transport == "inprocess"
+    assert result == {"snippets": snippets}
+    # Results are passed through without copying
+    assert result["snippets"] is snippets
+    assert retriever.queries == ["latency"]
+
+
+def test_unknown_transport_raises(manager_module, monkeypatch):
+    monkeypatch.setattr(manager_module.Config, "MCP_TRANSPORT", "grpc")
+
+    with pytest.raises(ValueError, match="Unsupported MCP transport"):
+        manager_module.ManagerAgent()
@@ -0,0 +1,83 @@
+from agents.session import ConversationSession
+from conftest import make_snippet
+
+
+def test_new_snippets_skips_held_and_repeated():
+    session = ConversationSession()
+    held = make_snippet("a.md", "Latency", "Latency dropped to 120ms")
+    session.record_turn({"role": "user", "content": "q"}, "answer", [held])
+
+    fresh = make_snippet("b.md", "Cost", "Cost per request fell")
+    result = session.new_snippets([
+        make_snippet("a.md", "Latency", "same section, new text"),
+        fresh,
+        dict(fresh),
+    ])
+
+    assert result == [fresh]
+    # Filtering alone does not hold anything
+    assert session.snippets == [held]
+
+
+def test_record_turn_holds_snippets_and_messages():
+    session = ConversationSession()
+    snippet = make_snippet("a.md", "Latency", "Latency dropped to 120ms")
+    user_message = {"role": "user", "content": "q"}
+
+    session.record_turn(user_message, "answer", [snippet])
+
+    assert session.snippets == [snippet]
+    assert session.messages == [user_message, {"role": "assistant", "content": "answer"}]
+    assert session.next_citation == 2
+
+
+def test_uncovered_terms_ignores_stopwords_and_held_terms():
+    session = ConversationSession()
+    assert session.uncovered_terms("and what about latency?") == ["latency"]
+
+    session.record_turn(
+        {"role": "user", "content": "q"}, "answer",
+        [make_snippet("a.md", "Latency", "Latency dropped to 120ms")],
+    )
+
+    assert session.uncovered_terms("and what about latency?") == []
+    assert session.uncovered_terms("What about Q3 throughput?") == ["q3", "throughput"]
+
+
+def test_uncovered_terms_matches_whole_words():
+    session = ConversationSession()
+    session.record_turn(
+        {"role": "user", "content": "q"}, "answer",
+        [make_snippet("a.md", "Misc", "The costume budget grew in Q20")],
+    )
+
+    assert session.uncovered_terms("cost in q2") == ["cost", "q2"]
+    assert session.uncovered_terms("costume q20") == []
+
+
+def test_eviction_drops_oldest_turn_snippets_and_keeps_numbering():
+    session = ConversationSession(max_turns=2, max_snippets=10)
+    for i in range(3):
+        session.record_turn(
+            {"role": "user", "content": f"q{i}"}, f"a{i}",
+            [make_snippet(f"{i}.md", "S", f"text {i}")],
+        )
+
+    assert [s["source"] for s in session.snippets] == ["1.md", "2.md"]
+    assert len(session.messages) == 4
+    assert session.first_citation == 2
+    assert session.next_citation == 4
+    assert session.turn_count == 3
+    # Evicted snippets count as unseen again
+    assert session.new_snippets([make_snippet("0.md", "S", "text 0")])
+
+
+def test_eviction_respects_snippet_budget_but_keeps_latest_turn():
+    session = ConversationSession(max_turns=10, max_snippets=3)
+    session.record_turn({"role": "user", "content": "q0"}, "a0",
+                        [make_snippet("a.md", str(i), "x") for i in range(2)])
+    session.record_turn({"role": "user", "content": "q1"}, "a1",
+                        [make_snippet("b.md", str(i), "y") for i in range(4)])
+
+    assert [s["source"] for s in session.snippets] == ["b.md"] * 4
+    assert session.first_citation == 3